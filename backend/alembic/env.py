@@ -4,7 +4,7 @@ Alembic environment configuration for async migrations.
 import asyncio
 from logging.config import fileConfig
 
-from sqlalchemy import pool
+from sqlalchemy import make_url, pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
@@ -44,6 +44,24 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+def include_object_for(dialect_name: str):
+    """
+    Build an autogenerate filter for the given dialect.
+    
+    Alembic ignores Index.ddl_if(), so without this a dialect-gated index
+    (e.g. idx_account_date_covering, PostgreSQL only) would be reported as
+    missing on every other database.
+    """
+    def include_object(object, name, type_, reflected, compare_to) -> bool:
+        if type_ == "index" and not reflected:
+            ddl_if = getattr(object, "_ddl_if", None)
+            if ddl_if is not None and ddl_if.dialect not in (None, dialect_name):
+                return False
+        return True
+    
+    return include_object
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -62,6 +80,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object_for(make_url(url).get_backend_name()),
     )
 
     with context.begin_transaction():
@@ -69,7 +88,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object_for(connection.dialect.name),
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,36 @@
+"""Replace trades status index with partial index on open trades
+
+Revision ID: 002_trades_open_index
+Revises: 001_initial
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_trades_open_index'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only open trades are ever looked up by status, so index just those rows
+    op.create_index(
+        'idx_trades_open',
+        'trades',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text("status = 'open'"),
+        sqlite_where=sa.text("status = 'open'"),
+    )
+    op.drop_index('idx_trades_status', table_name='trades')
+
+
+def downgrade() -> None:
+    op.create_index('idx_trades_status', 'trades', ['status'], unique=False)
+    op.drop_index('idx_trades_open', table_name='trades')
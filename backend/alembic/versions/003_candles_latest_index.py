@@ -0,0 +1,49 @@
+"""Add descending candles index for latest-candle lookups
+
+Revision ID: 003_candles_latest_index
+Revises: 002_trades_open_index
+Create Date: 2026-10-15 09:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003_candles_latest_index'
+down_revision: Union[str, None] = '002_trades_open_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Matches WHERE symbol = ? AND timeframe = ? ORDER BY timestamp DESC LIMIT n.
+    # Built outside the migration transaction (CONCURRENTLY on PostgreSQL)
+    # so candle writes keep running while a populated table is indexed.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_candles_latest',
+            'candles',
+            ['symbol', 'timeframe', sa.text('timestamp DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    
+    # Leading columns of the composite indexes; only slow down bulk writes
+    op.drop_index(op.f('ix_candles_symbol'), table_name='candles')
+    op.drop_index(op.f('ix_candles_timeframe'), table_name='candles')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_candles_timeframe'), 'candles', ['timeframe'], unique=False)
+    op.create_index(op.f('ix_candles_symbol'), 'candles', ['symbol'], unique=False)
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_candles_latest',
+            table_name='candles',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,30 @@
+"""Drop redundant single-column candles indexes
+
+Revision ID: 004_drop_candles_column_indexes
+Revises: 003_candles_latest_index
+Create Date: 2026-10-15 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004_drop_candles_column_indexes'
+down_revision: Union[str, None] = '003_candles_latest_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # timestamp is never queried without symbol/timeframe, and id is
+    # already covered by the primary key
+    op.drop_index(op.f('ix_candles_timestamp'), table_name='candles')
+    op.drop_index(op.f('ix_candles_id'), table_name='candles')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_candles_id'), 'candles', ['id'], unique=False)
+    op.create_index(op.f('ix_candles_timestamp'), 'candles', ['timestamp'], unique=False)
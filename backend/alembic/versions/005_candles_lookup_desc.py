@@ -0,0 +1,74 @@
+"""Make idx_candles_lookup descending on timestamp
+
+Revision ID: 005_candles_lookup_desc
+Revises: 004_drop_candles_column_indexes
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005_candles_lookup_desc'
+down_revision: Union[str, None] = '004_drop_candles_column_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Everything runs outside the migration transaction so PostgreSQL can
+    # build and drop concurrently without blocking candle writers
+    with op.get_context().autocommit_block():
+        # The ascending lookup index duplicates uix_candle_unique
+        op.drop_index(
+            'idx_candles_lookup',
+            table_name='candles',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        
+        # Rebuild it descending for latest-candle queries, then retire
+        # idx_candles_latest which it replaces
+        op.create_index(
+            'idx_candles_lookup',
+            'candles',
+            ['symbol', 'timeframe', sa.text('timestamp DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'idx_candles_latest',
+            table_name='candles',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_candles_latest',
+            'candles',
+            ['symbol', 'timeframe', sa.text('timestamp DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'idx_candles_lookup',
+            table_name='candles',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            'idx_candles_lookup',
+            'candles',
+            ['symbol', 'timeframe', 'timestamp'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
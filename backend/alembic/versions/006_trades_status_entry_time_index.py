@@ -0,0 +1,59 @@
+"""Add composite trades (status, entry_time DESC) index, drop idx_trades_open
+
+Revision ID: 006_trades_status_entry_time_index
+Revises: 005_candles_lookup_desc
+Create Date: 2026-10-15 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_trades_status_entry_time_index'
+down_revision: Union[str, None] = '005_candles_lookup_desc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Status filter plus newest-first ordering by entry time
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_trades_status_entry_time',
+            'trades',
+            ['status', sa.text('entry_time DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # The composite's leading status column now serves the open-trade
+        # count, which makes the partial index pure write overhead
+        op.drop_index(
+            'idx_trades_open',
+            table_name='trades',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_trades_open',
+            'trades',
+            ['id'],
+            unique=False,
+            postgresql_where=sa.text("status = 'open'"),
+            sqlite_where=sa.text("status = 'open'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'idx_trades_status_entry_time',
+            table_name='trades',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,51 @@
+"""Add covering index for dashboard account_state lookup
+
+Revision ID: 007_account_date_covering_index
+Revises: 006_trades_status_entry_time_index
+Create Date: 2026-10-15 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007_account_date_covering_index'
+down_revision: Union[str, None] = '006_trades_status_entry_time_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns read by the dashboard for today's row
+DASHBOARD_COLUMNS = [
+    'ending_capital',
+    'starting_capital',
+    'daily_pnl',
+    'daily_pnl_r',
+    'trades_count',
+    'kill_switch_triggered',
+]
+
+
+def upgrade() -> None:
+    # PostgreSQL only: SQLite has no INCLUDE, and a widened key index is
+    # never chosen over the unique date index there
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    
+    # Key on date only, carry the rest as non-key payload
+    op.create_index(
+        'idx_account_date_covering',
+        'account_state',
+        ['date'],
+        unique=False,
+        postgresql_include=DASHBOARD_COLUMNS,
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    
+    op.drop_index('idx_account_date_covering', table_name='account_state')
@@ -0,0 +1,58 @@
+"""Stamp created_at/updated_at with server-side defaults
+
+Revision ID: 008_timestamp_server_defaults
+Revises: 007_account_date_covering_index
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008_timestamp_server_defaults'
+down_revision: Union[str, None] = '007_account_date_covering_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Timestamp columns per table
+TIMESTAMP_COLUMNS = {
+    'candles': ['created_at'],
+    'trades': ['created_at', 'updated_at'],
+    'account_state': ['created_at', 'updated_at'],
+}
+
+# Descending indexes; SQLite reflection drops DESC when batch mode copies them
+DESC_INDEXES = {
+    'candles': ('idx_candles_lookup', ['symbol', 'timeframe', sa.text('timestamp DESC')]),
+    'trades': ('idx_trades_status_entry_time', ['status', sa.text('entry_time DESC')]),
+}
+
+
+def _set_server_default(server_default) -> None:
+    # SQLite can't ALTER a column default; batch mode recreates the table
+    is_sqlite = op.get_context().dialect.name == 'sqlite'
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(timezone=True),
+                    existing_nullable=True,
+                    server_default=server_default,
+                )
+        
+        if is_sqlite and table in DESC_INDEXES:
+            name, index_columns = DESC_INDEXES[table]
+            op.drop_index(name, table_name=table)
+            op.create_index(name, table, index_columns, unique=False)
+
+
+def upgrade() -> None:
+    _set_server_default(sa.func.now())
+
+
+def downgrade() -> None:
+    _set_server_default(None)
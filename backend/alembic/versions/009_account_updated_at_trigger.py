@@ -0,0 +1,46 @@
+"""Maintain account_state.updated_at with a trigger
+
+Revision ID: 009_account_updated_at_trigger
+Revises: 008_timestamp_server_defaults
+Create Date: 2026-10-15 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009_account_updated_at_trigger'
+down_revision: Union[str, None] = '008_timestamp_server_defaults'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        op.execute(
+            "CREATE OR REPLACE FUNCTION account_state_set_updated_at() RETURNS trigger AS $$ "
+            "BEGIN NEW.updated_at = now(); RETURN NEW; END; "
+            "$$ LANGUAGE plpgsql"
+        )
+        op.execute(
+            "CREATE TRIGGER trg_account_updated BEFORE UPDATE ON account_state "
+            "FOR EACH ROW EXECUTE FUNCTION account_state_set_updated_at()"
+        )
+    else:
+        # Recursive triggers are off by default, so the inner UPDATE doesn't re-fire
+        op.execute(
+            "CREATE TRIGGER trg_account_updated AFTER UPDATE ON account_state "
+            "BEGIN "
+            "UPDATE account_state SET updated_at = CURRENT_TIMESTAMP WHERE id = OLD.id; "
+            "END"
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        op.execute("DROP TRIGGER IF EXISTS trg_account_updated ON account_state")
+        op.execute("DROP FUNCTION IF EXISTS account_state_set_updated_at()")
+    else:
+        op.execute("DROP TRIGGER IF EXISTS trg_account_updated")
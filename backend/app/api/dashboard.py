@@ -1,10 +1,11 @@
 """
 Dashboard and health check endpoints.
 """
+import asyncio
 from datetime import datetime, date
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc
+from sqlalchemy import select, func, desc, RowMapping
 from pydantic import BaseModel
 
 from app.database import get_db
@@ -15,16 +16,20 @@ from app.utils.validators import (
     DashboardAccount,
     DashboardMarket,
     DashboardRiskStatus,
-    is_market_open,
-    is_time_valid_for_trading,
-    get_minutes_to_close,
+    evaluate_market_state,
 )
 from app.models import AccountState, Trade, Candle
-from app.data.nifty_fetcher import NIFTYDataFetcher
+from app.models.account import DASHBOARD_COLUMNS
+from app.data.nifty_fetcher import NIFTYDataFetcher, get_nifty_fetcher
 from app.utils.logger import logger
 
 router = APIRouter(prefix="/api/v1", tags=["dashboard"])
 
+# Core tables for read-only queries (no ORM hydration)
+account_table = AccountState.__table__
+trade_table = Trade.__table__
+candle_table = Candle.__table__
+
 
 class KillSwitchRequest(BaseModel):
     """Kill switch activation request."""
@@ -52,42 +57,65 @@ async def health_check(db: AsyncSession = Depends(get_db)) -> HealthResponse:
     # Check if kill switch is active for today
     today = now.date()
     result = await db.execute(
-        select(AccountState).where(AccountState.date == today)
+        select(account_table.c.kill_switch_triggered).where(account_table.c.date == today)
     )
-    account = result.scalar_one_or_none()
-    
-    kill_switch_active = account.kill_switch_triggered if account else False
+    kill_switch_active = result.scalar() or False
     
     return HealthResponse(
         status="ok",
         timestamp=now,
-        market_open=is_market_open(now),
+        market_open=evaluate_market_state(now).is_open,
         kill_switch_active=kill_switch_active,
     )
 
 
-@router.get("/dashboard", response_model=DashboardResponse)
-async def get_dashboard(db: AsyncSession = Depends(get_db)) -> DashboardResponse:
+async def _get_dashboard_row(db: AsyncSession, today: date) -> RowMapping:
     """
-    Get dashboard data.
+    Load everything the dashboard reads from the database in one query.
     
+    Today's account columns are selected together with scalar subqueries
+    for the open position count and the last stored NIFTY close, so the
+    dashboard needs a single round trip. Today's account row is created
+    first if it does not exist yet.
+    
+    Args:
+        db: Database session
+        today: Trading date
+        
     Returns:
-        Complete dashboard information including account, market, and risk status
+        Row mapping with DASHBOARD_COLUMNS, open_positions and last_close
     """
-    now = datetime.now(settings.timezone)
-    today = now.date()
-    
-    logger.info(f"Dashboard request at {now}")
-    
-    # Get or create today's account state
-    result = await db.execute(
-        select(AccountState).where(AccountState.date == today)
+    open_positions = (
+        select(func.count())
+        .select_from(trade_table)
+        .where(trade_table.c.status == "open")
+        .scalar_subquery()
+    )
+    # Latest 5m close, served by idx_candles_lookup
+    last_close = (
+        select(candle_table.c.close)
+        .where(
+            candle_table.c.symbol == "NIFTY",
+            candle_table.c.timeframe == "5m"
+        )
+        .order_by(desc(candle_table.c.timestamp))
+        .limit(1)
+        .scalar_subquery()
+    )
+    dashboard_query = (
+        select(
+            *(account_table.c[name] for name in DASHBOARD_COLUMNS),
+            open_positions.label("open_positions"),
+            last_close.label("last_close"),
+        )
+        .where(account_table.c.date == today)
     )
-    account = result.scalar_one_or_none()
     
-    if not account:
+    row = (await db.execute(dashboard_query)).mappings().one_or_none()
+    
+    if row is None:
         # Create account for today
-        account = AccountState(
+        db.add(AccountState(
             date=today,
             starting_capital=settings.default_capital,
             daily_pnl=0,
@@ -96,72 +124,81 @@ async def get_dashboard(db: AsyncSession = Depends(get_db)) -> DashboardResponse
             wins=0,
             losses=0,
             kill_switch_triggered=False,
-        )
-        db.add(account)
+        ))
         await db.commit()
-        await db.refresh(account)
+        row = (await db.execute(dashboard_query)).mappings().one()
+    
+    return row
+
+
+@router.get("/dashboard", response_model=DashboardResponse)
+async def get_dashboard(
+    db: AsyncSession = Depends(get_db),
+    fetcher: NIFTYDataFetcher = Depends(get_nifty_fetcher)
+) -> DashboardResponse:
+    """
+    Get dashboard data.
+    
+    Returns:
+        Complete dashboard information including account, market, and risk status
+    """
+    now = datetime.now(settings.timezone)
+    today = now.date()
+    
+    logger.info(f"Dashboard request at {now}")
     
-    # Count open positions
-    open_positions_result = await db.execute(
-        select(func.count(Trade.id)).where(Trade.status == "open")
+    # Fetch the REAL NIFTY price while the dashboard query runs
+    account, nifty_spot = await asyncio.gather(
+        _get_dashboard_row(db, today),
+        fetcher.get_current_price(),
     )
-    open_positions = open_positions_result.scalar() or 0
     
     # Build account data
     account_data = DashboardAccount(
-        capital=float(account.current_capital),
-        daily_pnl=float(account.daily_pnl or 0),
-        daily_pnl_r=float(account.daily_pnl_r or 0),
-        open_positions=open_positions,
-        trades_today=account.trades_count,
+        capital=float(account["ending_capital"] or account["starting_capital"]),
+        daily_pnl=float(account["daily_pnl"] or 0),
+        daily_pnl_r=float(account["daily_pnl_r"] or 0),
+        open_positions=account["open_positions"],
+        trades_today=account["trades_count"],
     )
     
-    # Build market data with REAL NIFTY price
-    fetcher = NIFTYDataFetcher()
-    nifty_spot = fetcher.get_current_price()
-    
+    # Build market data
     if nifty_spot is None:
         # Fallback to last known price from database if Yahoo Finance is unavailable
-        result = await db.execute(
-            select(Candle)
-            .where(Candle.symbol == "NIFTY")
-            .order_by(desc(Candle.timestamp))
-            .limit(1)
-        )
-        last_candle = result.scalar_one_or_none()
-        nifty_spot = float(last_candle.close) if last_candle else 22347.50
+        last_close = account["last_close"]
+        nifty_spot = float(last_close) if last_close is not None else 22347.50
         logger.warning(f"Using fallback price: {nifty_spot}")
     
+    market_state = evaluate_market_state(now)
+    
     market_data = DashboardMarket(
         nifty_spot=nifty_spot,
         time=now,
-        is_open=is_market_open(now),
-        minutes_to_close=get_minutes_to_close(now),
+        is_open=market_state.is_open,
+        minutes_to_close=market_state.minutes_to_close,
     )
     
     # Determine if trading is allowed
     can_trade = True
     reason = "All systems operational"
     
-    if account.kill_switch_triggered:
+    if account["kill_switch_triggered"]:
         can_trade = False
         reason = "Kill switch active"
-    elif account.trades_count >= settings.max_daily_trades:
+    elif account["trades_count"] >= settings.max_daily_trades:
         can_trade = False
-        reason = f"Max daily trades reached ({account.trades_count}/{settings.max_daily_trades})"
-    elif account.daily_pnl_r and account.daily_pnl_r <= -settings.max_daily_loss_r:
+        reason = f"Max daily trades reached ({account['trades_count']}/{settings.max_daily_trades})"
+    elif account["daily_pnl_r"] and account["daily_pnl_r"] <= -settings.max_daily_loss_r:
         can_trade = False
-        reason = f"Max daily loss reached ({account.daily_pnl_r:.2f}R)"
-    else:
-        time_valid, time_reason = is_time_valid_for_trading(now)
-        if not time_valid:
-            can_trade = False
-            reason = time_reason
+        reason = f"Max daily loss reached ({account['daily_pnl_r']:.2f}R)"
+    elif not market_state.can_trade:
+        can_trade = False
+        reason = market_state.reason
     
     risk_status = DashboardRiskStatus(
         can_trade=can_trade,
         reason=reason,
-        kill_switch=account.kill_switch_triggered,
+        kill_switch=account["kill_switch_triggered"],
     )
     
     return DashboardResponse(
@@ -209,7 +246,6 @@ async def activate_kill_switch(
         db.add(account)
     else:
         account.kill_switch_triggered = request.activate
-        account.updated_at = now
     
     await db.commit()
     logger.info(f"Kill switch {'activated' if request.activate else 'deactivated'} - Reason: {request.reason}")
@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
 from app.database import get_db
-from app.data.nifty_fetcher import NIFTYDataFetcher
+from app.data.nifty_fetcher import NIFTYDataFetcher, get_nifty_fetcher
 from app.models.candle import Candle
 from app.config import settings
 from app.utils.logger import logger
@@ -42,15 +42,16 @@ class CurrentPriceResponse(BaseModel):
 
 
 @router.get("/current-price", response_model=CurrentPriceResponse)
-async def get_current_price() -> CurrentPriceResponse:
+async def get_current_price(
+    fetcher: NIFTYDataFetcher = Depends(get_nifty_fetcher)
+) -> CurrentPriceResponse:
     """
     Get current NIFTY spot price.
     
     Returns:
         Current price from Yahoo Finance
     """
-    fetcher = NIFTYDataFetcher()
-    price = fetcher.get_current_price()
+    price = await fetcher.get_current_price()
     
     if price is None:
         raise HTTPException(status_code=503, detail="Unable to fetch current price")
@@ -66,7 +67,8 @@ async def get_current_price() -> CurrentPriceResponse:
 async def get_candles(
     timeframe: str = Query("5m", description="Timeframe: 5m, 15m, 1h, 1d"),
     limit: int = Query(100, ge=1, le=500, description="Number of candles"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    fetcher: NIFTYDataFetcher = Depends(get_nifty_fetcher)
 ) -> CandlesResponse:
     """
     Get historical candles from database.
@@ -75,11 +77,11 @@ async def get_candles(
         timeframe: Candle timeframe
         limit: Number of candles to return
         db: Database session
+        fetcher: Shared NIFTY data fetcher
         
     Returns:
         List of candles
     """
-    fetcher = NIFTYDataFetcher()
     candles = await fetcher.get_latest_candles(timeframe, limit, db)
     
     candle_responses = [
@@ -106,7 +108,8 @@ async def get_candles(
 async def update_market_data(
     timeframe: str = Query("5m", description="Timeframe to update"),
     days: int = Query(7, ge=1, le=60, description="Days back to fetch"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    fetcher: NIFTYDataFetcher = Depends(get_nifty_fetcher)
 ):
     """
     Fetch and update market data from Yahoo Finance.
@@ -115,14 +118,13 @@ async def update_market_data(
         timeframe: Timeframe to fetch (5m, 15m)
         days: Number of days back to fetch
         db: Database session
+        fetcher: Shared NIFTY data fetcher
         
     Returns:
         Status and count of candles saved
     """
     logger.info(f"Updating {timeframe} data for last {days} days")
     
-    fetcher = NIFTYDataFetcher()
-    
     try:
         saved_count = await fetcher.update_latest_data(timeframe, db, days_back=days)
         
@@ -136,3 +138,41 @@ async def update_market_data(
     except Exception as e:
         logger.error(f"Error updating data: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/update-data/bulk")
+async def update_market_data_bulk(
+    timeframes: List[str] = Query(["5m", "15m"], description="Timeframes to update"),
+    days: int = Query(7, ge=1, le=60, description="Days back to fetch"),
+    db: AsyncSession = Depends(get_db),
+    fetcher: NIFTYDataFetcher = Depends(get_nifty_fetcher)
+):
+    """
+    Fetch and update market data for several timeframes at once.
+    
+    The Yahoo Finance downloads run in parallel.
+    
+    Args:
+        timeframes: Timeframes to fetch (5m, 15m, 1h, 1d)
+        days: Number of days back to fetch
+        db: Database session
+        fetcher: Shared NIFTY data fetcher
+        
+    Returns:
+        Status and count of candles saved per timeframe
+    """
+    logger.info(f"Updating {', '.join(timeframes)} data for last {days} days")
+    
+    try:
+        saved_counts = await fetcher.update_many_timeframes(timeframes, db, days_back=days)
+        
+        return {
+            "status": "success",
+            "timeframes": timeframes,
+            "days_fetched": days,
+            "candles_saved": saved_counts,
+            "timestamp": datetime.now(settings.timezone)
+        }
+    except Exception as e:
+        logger.error(f"Error updating data: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -6,7 +6,8 @@ from typing import List
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from datetime import time
-import pytz
+from functools import cached_property, lru_cache
+from zoneinfo import ZoneInfo
 
 
 class Settings(BaseSettings):
@@ -24,12 +25,18 @@ class Settings(BaseSettings):
     env: str = Field(default="development", description="Environment: development, production")
     log_level: str = Field(default="INFO", description="Logging level")
     tz: str = Field(default="Asia/Kolkata", description="Timezone")
+    workers: int = Field(
+        default=2,
+        description="Uvicorn worker processes in production (each has its own DB pool)"
+    )
     
     # Database
     database_url: str = Field(
         default="sqlite+aiosqlite:///./methax.db",
         description="Async database URL"
     )
+    db_pool_size: int = Field(default=10, description="Persistent connections kept in the pool")
+    db_max_overflow: int = Field(default=20, description="Extra connections allowed under load")
     
     # Trading Parameters
     default_capital: float = Field(default=100000.0, description="Starting capital in INR")
@@ -59,6 +66,10 @@ class Settings(BaseSettings):
     # Data Source
     use_mock_data: bool = Field(default=True, description="Use mock data generator")
     nse_api_key: str = Field(default="", description="NSE API key")
+    price_cache_ttl_seconds: float = Field(
+        default=2.0,
+        description="How long a fetched spot price is reused"
+    )
     
     # WebSocket
     ws_update_interval_seconds: int = Field(default=5, description="WS market update interval")
@@ -81,13 +92,15 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",")]
         return v
     
-    @property
-    def timezone(self) -> pytz.timezone:
-        """Get timezone object."""
-        return pytz.timezone(self.tz)
+    @cached_property
+    def timezone(self) -> ZoneInfo:
+        """Get timezone object (resolved once)."""
+        return ZoneInfo(self.tz)
     
-    def get_time(self, time_str: str) -> time:
-        """Convert time string (HH:MM) to time object."""
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def get_time(time_str: str) -> time:
+        """Convert time string (HH:MM) to time object (memoized)."""
         hours, minutes = map(int, time_str.split(":"))
         return time(hour=hours, minute=minutes)
     
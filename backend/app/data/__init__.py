@@ -1,6 +1,6 @@
 """
 Data package for market data fetching and management.
 """
-from app.data.nifty_fetcher import NIFTYDataFetcher
+from app.data.nifty_fetcher import NIFTYDataFetcher, get_nifty_fetcher
 
-__all__ = ["NIFTYDataFetcher"]
+__all__ = ["NIFTYDataFetcher", "get_nifty_fetcher"]
@@ -3,17 +3,29 @@ NIFTY 50 data fetcher using Yahoo Finance.
 
 Fetches REAL market data for virtual trading.
 """
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional
 import yfinance as yf
 import pandas as pd
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, func, and_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.models.candle import Candle
 from app.config import settings
 from app.utils.logger import logger
 
+# Dialect-specific INSERT constructs that support ON CONFLICT
+UPSERT_INSERTS = {
+    'postgresql': postgresql_insert,
+    'sqlite': sqlite_insert,
+}
+
 
 class NIFTYDataFetcher:
     """
@@ -24,10 +36,33 @@ class NIFTYDataFetcher:
     
     SYMBOL = "^NSEI"  # Yahoo Finance ticker for NIFTY 50
     DB_SYMBOL = "NIFTY"  # Our internal symbol name
+    OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+    
+    # Yahoo Finance history columns -> our schema
+    COLUMN_MAP = {
+        'Open': 'open',
+        'High': 'high',
+        'Low': 'low',
+        'Close': 'close',
+        'Volume': 'volume'
+    }
+    SAVE_BATCH_SIZE = 500  # Candles written per transaction
+    
+    # Map our timeframe to Yahoo Finance interval
+    INTERVAL_MAP = {
+        '5m': '5m',
+        '15m': '15m',
+        '1h': '1h',
+        '1d': '1d'
+    }
     
     def __init__(self):
         """Initialize NIFTY data fetcher."""
-        self.ticker = yf.Ticker(self.SYMBOL)
+        # Short-lived spot price cache shared by concurrent requests
+        self._price_lock = asyncio.Lock()
+        self._cached_price: Optional[float] = None
+        self._cached_price_at = float('-inf')
+        
         logger.info(f"NIFTYDataFetcher initialized for {self.SYMBOL}")
     
     def fetch_historical_data(
@@ -59,8 +94,10 @@ class NIFTYDataFetcher:
         )
         
         try:
-            # Fetch data from Yahoo Finance
-            df = self.ticker.history(
+            # Fetch data from Yahoo Finance. history() stores request
+            # metadata on the Ticker and reads it back, so each call (possibly
+            # on its own worker thread) gets a fresh one
+            df = yf.Ticker(self.SYMBOL).history(
                 start=start_date,
                 end=end_date,
                 interval=interval,
@@ -72,26 +109,19 @@ class NIFTYDataFetcher:
                 logger.warning(f"No data returned for {start_date} to {end_date}")
                 return pd.DataFrame()
             
-            # Reset index to get timestamp as column
-            df = df.reset_index()
-            
-            # Rename columns to match our schema
-            df = df.rename(columns={
-                'Datetime': 'timestamp',
-                'Open': 'open',
-                'High': 'high',
-                'Low': 'low',
-                'Close': 'close',
-                'Volume': 'volume'
+            # Build our schema in one pass: the index (Datetime, or Date for
+            # daily candles) becomes 'timestamp', OHLCV columns are renamed
+            df = pd.DataFrame({
+                'timestamp': df.index,
+                **{col: df[src].to_numpy() for src, col in self.COLUMN_MAP.items()}
             })
             
-            # Keep only required columns
-            df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
-            
-            # Convert to IST timezone
-            df['timestamp'] = pd.to_datetime(df['timestamp']).dt.tz_convert(
-                settings.timezone
-            )
+            # Convert to IST timezone (yfinance index is already datetime,
+            # usually tz-aware; only naive timestamps need localizing)
+            timestamps = df['timestamp']
+            if timestamps.dt.tz is None:
+                timestamps = timestamps.dt.tz_localize('UTC')
+            df['timestamp'] = timestamps.dt.tz_convert(settings.timezone)
             
             logger.info(f"Fetched {len(df)} candles")
             return df
@@ -100,70 +130,137 @@ class NIFTYDataFetcher:
             logger.error(f"Error fetching data: {e}")
             raise
     
+    def fetch_many(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        intervals: List[str]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch several intervals from Yahoo Finance in parallel.
+        
+        Each interval is a separate history() request on its own Ticker,
+        so running them on a thread pool overlaps their network waits.
+        
+        Args:
+            start_date: Start datetime
+            end_date: End datetime
+            intervals: Candle intervals ('5m', '15m', '1h', '1d')
+            
+        Returns:
+            DataFrame with OHLCV data per interval
+        """
+        if not intervals:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=len(intervals)) as executor:
+            futures = {
+                interval: executor.submit(
+                    self.fetch_historical_data, start_date, end_date, interval
+                )
+                for interval in intervals
+            }
+            return {interval: future.result() for interval, future in futures.items()}
+    
     async def save_candles_to_db(
         self,
         df: pd.DataFrame,
         timeframe: str,
-        db: AsyncSession
+        db: AsyncSession,
+        overwrite: bool = True
     ) -> int:
         """
         Save candles to database (insert or update).
         
+        Uses bulk upserts keyed on (symbol, timeframe, timestamp). Rows are
+        written and committed in batches of SAVE_BATCH_SIZE.
+        
         Args:
             df: DataFrame with OHLCV data
             timeframe: Timeframe (5m, 15m, etc.)
             db: Database session
+            overwrite: Update candles that already exist; when False they
+                are left untouched (ON CONFLICT DO NOTHING)
             
         Returns:
-            Number of candles saved
+            Number of candles inserted or updated
         """
         if df.empty:
             logger.warning("No candles to save (empty DataFrame)")
             return 0
         
+        dialect = db.bind.dialect.name
+        if dialect not in UPSERT_INSERTS:
+            raise ValueError(f"Unsupported database dialect: {dialect}")
+        
+        # Convert whole columns to native Python values up front instead of
+        # boxing a Series per row with iterrows()
+        timestamps = pd.DatetimeIndex(df['timestamp']).to_pydatetime()
+        opens = df['open'].to_numpy(dtype='float64').tolist()
+        highs = df['high'].to_numpy(dtype='float64').tolist()
+        lows = df['low'].to_numpy(dtype='float64').tolist()
+        closes = df['close'].to_numpy(dtype='float64').tolist()
+        volumes = df['volume'].to_numpy(dtype='int64').tolist()
+        
+        rows = [
+            {
+                'symbol': self.DB_SYMBOL,
+                'timeframe': timeframe,
+                'timestamp': t,
+                'open': o,
+                'high': h,
+                'low': l,
+                'close': c,
+                'volume': v,
+            }
+            for t, o, h, l, c, v in zip(timestamps, opens, highs, lows, closes, volumes)
+        ]
+        
         saved_count = 0
         
-        for _, row in df.iterrows():
-            timestamp = row['timestamp'].to_pydatetime()
-            
-            # Check if candle already exists
-            result = await db.execute(
-                select(Candle).where(
-                    and_(
-                        Candle.symbol == self.DB_SYMBOL,
-                        Candle.timeframe == timeframe,
-                        Candle.timestamp == timestamp
-                    )
-                )
-            )
-            existing_candle = result.scalar_one_or_none()
+        # Write in pages, committing each one, so a large backfill never
+        # holds one long transaction (or exceeds bound-parameter limits)
+        for start in range(0, len(rows), self.SAVE_BATCH_SIZE):
+            batch = rows[start:start + self.SAVE_BATCH_SIZE]
             
-            if existing_candle:
-                # Update existing candle
-                existing_candle.open = float(row['open'])
-                existing_candle.high = float(row['high'])
-                existing_candle.low = float(row['low'])
-                existing_candle.close = float(row['close'])
-                existing_candle.volume = int(row['volume'])
-            else:
-                # Create new candle
-                candle = Candle(
-                    symbol=self.DB_SYMBOL,
-                    timeframe=timeframe,
-                    timestamp=timestamp,
-                    open=float(row['open']),
-                    high=float(row['high']),
-                    low=float(row['low']),
-                    close=float(row['close']),
-                    volume=int(row['volume']),
-                )
-                db.add(candle)
-                saved_count += 1
+            saved_count += await self._upsert_candles(batch, dialect, db, overwrite)
+            await db.commit()
         
-        await db.commit()
-        logger.info(f"Saved {saved_count} new candles to database")
+        logger.info(f"Saved {saved_count} candles to database")
         return saved_count
     
+    async def _upsert_candles(
+        self,
+        rows: List[Dict],
+        dialect: str,
+        db: AsyncSession,
+        overwrite: bool = True
+    ) -> int:
+        """
+        Single INSERT ... ON CONFLICT DO UPDATE (or DO NOTHING) for all rows.
+        
+        Args:
+            rows: Candle rows as column dicts
+            dialect: Database dialect name (key of UPSERT_INSERTS)
+            db: Database session
+            overwrite: Update existing candles instead of skipping them
+            
+        Returns:
+            Number of candles inserted or updated
+        """
+        stmt = UPSERT_INSERTS[dialect](Candle).values(rows)
+        if overwrite:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['symbol', 'timeframe', 'timestamp'],
+                set_={c: stmt.excluded[c] for c in self.OHLCV_COLUMNS}
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=['symbol', 'timeframe', 'timestamp']
+            )
+        result = await db.execute(stmt)
+        return result.rowcount
+    
     async def get_latest_candles(
         self,
         timeframe: str,
@@ -214,25 +311,19 @@ class NIFTYDataFetcher:
         Returns:
             Number of candles saved
         """
-        # Map our timeframe to Yahoo Finance interval
-        interval_map = {
-            '5m': '5m',
-            '15m': '15m',
-            '1h': '1h',
-            '1d': '1d'
-        }
-        
-        if timeframe not in interval_map:
+        if timeframe not in self.INTERVAL_MAP:
             raise ValueError(f"Unsupported timeframe: {timeframe}")
         
-        interval = interval_map[timeframe]
+        interval = self.INTERVAL_MAP[timeframe]
         
         # Calculate date range
         end_date = datetime.now(settings.timezone)
         start_date = end_date - timedelta(days=days_back)
         
-        # Fetch data
-        df = self.fetch_historical_data(start_date, end_date, interval)
+        # Fetch data (download and pandas transforms run in a worker thread)
+        df = await asyncio.to_thread(
+            self.fetch_historical_data, start_date, end_date, interval
+        )
         
         if df.empty:
             logger.warning(f"No data fetched for {timeframe}")
@@ -242,16 +333,92 @@ class NIFTYDataFetcher:
         saved_count = await self.save_candles_to_db(df, timeframe, db)
         return saved_count
     
-    def get_current_price(self) -> Optional[float]:
+    async def update_many_timeframes(
+        self,
+        timeframes: List[str],
+        db: AsyncSession,
+        days_back: int = 7
+    ) -> Dict[str, int]:
+        """
+        Update database with latest NIFTY data for several timeframes.
+        
+        All timeframes are downloaded in parallel, then saved one by one.
+        
+        Args:
+            timeframes: Timeframes (5m, 15m, ...)
+            db: Database session
+            days_back: How many days back to fetch
+            
+        Returns:
+            Number of candles saved per timeframe
+        """
+        unsupported = [tf for tf in timeframes if tf not in self.INTERVAL_MAP]
+        if unsupported:
+            raise ValueError(f"Unsupported timeframe: {', '.join(unsupported)}")
+        
+        # Calculate date range
+        end_date = datetime.now(settings.timezone)
+        start_date = end_date - timedelta(days=days_back)
+        
+        frames = await asyncio.to_thread(
+            self.fetch_many,
+            start_date,
+            end_date,
+            [self.INTERVAL_MAP[tf] for tf in timeframes]
+        )
+        
+        saved_counts = {}
+        for timeframe in timeframes:
+            df = frames[self.INTERVAL_MAP[timeframe]]
+            
+            if df.empty:
+                logger.warning(f"No data fetched for {timeframe}")
+                saved_counts[timeframe] = 0
+                continue
+            
+            saved_counts[timeframe] = await self.save_candles_to_db(df, timeframe, db)
+        
+        return saved_counts
+    
+    async def get_current_price(self) -> Optional[float]:
         """
         Get current NIFTY spot price.
         
+        Results are cached for settings.price_cache_ttl_seconds, failures
+        (None) included, so callers queued on the lock while Yahoo Finance
+        is down reuse the failed attempt instead of each waiting out their
+        own timeout.
+        
+        Returns:
+            Current price or None if unavailable
+        """
+        async with self._price_lock:
+            age = time.monotonic() - self._cached_price_at
+            if age < settings.price_cache_ttl_seconds:
+                return self._cached_price
+            
+            # yfinance is blocking; keep it off the event loop
+            current_price = await asyncio.to_thread(self._fetch_current_price)
+            
+            self._cached_price = current_price
+            self._cached_price_at = time.monotonic()
+            
+            return current_price
+    
+    def _fetch_current_price(self) -> Optional[float]:
+        """
+        Fetch current NIFTY spot price from Yahoo Finance (uncached).
+        
         Returns:
             Current price or None if unavailable
         """
         try:
+            # Own Ticker per call: this runs on worker threads alongside
+            # fetch_historical_data
+            ticker = yf.Ticker(self.SYMBOL)
+            
             # Get fast info (doesn't require full download)
-            info = self.ticker.fast_info
+            info = ticker.fast_info
             current_price = info.get('last_price')
             
             if current_price:
@@ -259,7 +426,7 @@ class NIFTYDataFetcher:
                 return float(current_price)
             
             # Fallback: get latest from history
-            df = self.ticker.history(period='1d', interval='1m')
+            df = ticker.history(period='1d', interval='1m')
             if not df.empty:
                 current_price = float(df['Close'].iloc[-1])
                 logger.info(f"Current NIFTY price (from history): {current_price}")
@@ -272,6 +439,28 @@ class NIFTYDataFetcher:
             logger.error(f"Error getting current price: {e}")
             return None
     
+    async def count_candles(self, timeframe: str, db: AsyncSession) -> int:
+        """
+        Count candles stored for a timeframe.
+        
+        Args:
+            timeframe: Timeframe (5m, 15m)
+            db: Database session
+            
+        Returns:
+            Number of candles in database
+        """
+        result = await db.execute(
+            select(func.count(Candle.id))
+            .where(
+                and_(
+                    Candle.symbol == self.DB_SYMBOL,
+                    Candle.timeframe == timeframe
+                )
+            )
+        )
+        return result.scalar_one()
+    
     async def ensure_data_available(
         self,
         timeframe: str,
@@ -290,16 +479,7 @@ class NIFTYDataFetcher:
             True if sufficient data available
         """
         # Check how many candles we have
-        result = await db.execute(
-            select(Candle)
-            .where(
-                and_(
-                    Candle.symbol == self.DB_SYMBOL,
-                    Candle.timeframe == timeframe
-                )
-            )
-        )
-        count = len(result.scalars().all())
+        count = await self.count_candles(timeframe, db)
         
         logger.info(f"Database has {count} {timeframe} candles (need {required_candles})")
         
@@ -313,15 +493,24 @@ class NIFTYDataFetcher:
         await self.update_latest_data(timeframe, db, days_back=30)
         
         # Re-check
-        result = await db.execute(
-            select(Candle)
-            .where(
-                and_(
-                    Candle.symbol == self.DB_SYMBOL,
-                    Candle.timeframe == timeframe
-                )
-            )
-        )
-        count = len(result.scalars().all())
+        count = await self.count_candles(timeframe, db)
         
         return count >= required_candles
+
+
+@lru_cache(maxsize=1)
+def get_nifty_fetcher() -> NIFTYDataFetcher:
+    """
+    Get the shared NIFTY data fetcher.
+    
+    Reusing one instance shares the spot price cache (and its lock)
+    across requests. yfinance Tickers are created per call since they
+    are not safe to share between threads; the HTTP session lives in
+    yfinance's own singleton either way.
+    
+    Usage in FastAPI:
+        @app.get("/endpoint")
+        async def endpoint(fetcher: NIFTYDataFetcher = Depends(get_nifty_fetcher)):
+            ...
+    """
+    return NIFTYDataFetcher()
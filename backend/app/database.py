@@ -1,24 +1,64 @@
 """
 Async SQLAlchemy database setup and session management.
 """
+from contextlib import AsyncExitStack
 from typing import AsyncGenerator
+from sqlalchemy import event, make_url, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
     async_sessionmaker,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.config import settings
 
 
+# Pool persistent connections. aiosqlite defaults to NullPool for file
+# databases, which opens a new connection (and re-runs the PRAGMAs) per
+# session; in-memory SQLite keeps its single shared StaticPool.
+#
+# Pooled aiosqlite connections each keep a worker thread alive, so any
+# standalone script that uses the engine or AsyncSessionLocal must
+# `await close_db()` before exiting or the interpreter hangs at shutdown.
+database_url = make_url(settings.database_url)
+pool_options = {}
+if database_url.database not in (None, "", ":memory:"):
+    pool_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+    }
+    if database_url.get_backend_name() == "sqlite":
+        pool_options["poolclass"] = AsyncAdaptedQueuePool
+
 # Create async engine
 engine = create_async_engine(
-    settings.database_url,
+    database_url,
     echo=settings.is_development,
     future=True,
     pool_pre_ping=True,
+    **pool_options,
+)
+
+# SQLite tuning applied to every new connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
 )
 
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Enable WAL and relaxed fsync so bulk candle writes aren't fsync-bound."""
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -55,11 +95,36 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def init_db() -> None:
-    """Initialize database tables (for development)."""
+    """
+    Initialize database tables (for development).
+    
+    Scripts calling this outside the app lifespan must also
+    `await close_db()` before exiting (see the pool note above).
+    """
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warm_up_db() -> int:
+    """
+    Open the pool's persistent connections so first requests skip connect cost.
+    
+    Returns:
+        Number of connections opened (0 when the pool doesn't persist them)
+    """
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, QueuePool):
+        return 0
+    
+    # Hold the connections together so each SELECT 1 checks out a new one
+    async with AsyncExitStack() as stack:
+        for _ in range(pool.size()):
+            conn = await stack.enter_async_context(engine.connect())
+            await conn.execute(text("SELECT 1"))
+    
+    return pool.size()
+
+
 async def close_db() -> None:
     """Close database connections on shutdown."""
     await engine.dispose()
@@ -4,9 +4,10 @@ FastAPI application entry point.
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
-from app.database import init_db, close_db
+from app.database import init_db, warm_up_db, close_db
 from app.api import dashboard_router, market_data_router
 from app.data.nifty_fetcher import NIFTYDataFetcher
 from app.utils.logger import logger
@@ -26,6 +27,9 @@ async def lifespan(app: FastAPI):
         await init_db()
         logger.info("Database initialized")
     
+    warmed = await warm_up_db()
+    logger.info(f"Database pool warmed ({warmed} connections)")
+    
     logger.info(f"Trading parameters: Capital=₹{settings.default_capital}, "
                 f"MaxTrades={settings.max_daily_trades}, Risk={settings.risk_per_trade*100}%")
     
@@ -43,6 +47,7 @@ app = FastAPI(
     description="Institution-grade NIFTY 50 options virtual trading platform",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -50,8 +55,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists keep preflight checks to set lookups (no wildcard reflection)
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["content-type", "authorization"],
 )
 
 # Register routers
@@ -72,10 +78,6 @@ async def root():
 
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=settings.is_development,
-    )
+    # Launch settings live in run.py
+    from run import main
+    main()
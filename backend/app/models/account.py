@@ -1,19 +1,34 @@
 """
 Account state model.
 """
-from datetime import datetime, date
+from datetime import date
 from sqlalchemy import (
+    DDL,
     Column,
     Integer,
     Date,
     Numeric,
     Boolean,
     DateTime,
+    Index,
+    func,
     UniqueConstraint,
+    event,
 )
 from app.database import Base
 
 
+# Columns read by the dashboard for today's row, carried in the covering index
+DASHBOARD_COLUMNS = (
+    'ending_capital',
+    'starting_capital',
+    'daily_pnl',
+    'daily_pnl_r',
+    'trades_count',
+    'kill_switch_triggered',
+)
+
+
 class AccountState(Base):
     """
     Daily account state model.
@@ -28,12 +43,12 @@ class AccountState(Base):
     date = Column(Date, nullable=False, unique=True, index=True)
     
     # Capital tracking
-    starting_capital = Column(Numeric(10, 2), nullable=False)
-    ending_capital = Column(Numeric(10, 2), nullable=True)
+    starting_capital = Column(Numeric(10, 2, asdecimal=False), nullable=False)
+    ending_capital = Column(Numeric(10, 2, asdecimal=False), nullable=True)
     
     # P&L
-    daily_pnl = Column(Numeric(10, 2), nullable=True, default=0)
-    daily_pnl_r = Column(Numeric(5, 3), nullable=True, default=0)
+    daily_pnl = Column(Numeric(10, 2, asdecimal=False), nullable=True, default=0)
+    daily_pnl_r = Column(Numeric(5, 3, asdecimal=False), nullable=True, default=0)
     
     # Trade statistics
     trades_count = Column(Integer, default=0)
@@ -44,11 +59,20 @@ class AccountState(Base):
     kill_switch_triggered = Column(Boolean, default=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Maintained by the trg_account_updated trigger
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
     
     __table_args__ = (
         UniqueConstraint('date', name='uix_account_date'),
+        # Covering index so the dashboard's lookup by date is index-only.
+        # PostgreSQL only: SQLite has no INCLUDE, and its planner sticks with
+        # the unique date index anyway
+        Index(
+            'idx_account_date_covering',
+            'date',
+            postgresql_include=list(DASHBOARD_COLUMNS),
+        ).ddl_if(dialect='postgresql'),
     )
     
     def __repr__(self) -> str:
@@ -68,3 +92,34 @@ class AccountState(Base):
         if self.trades_count == 0:
             return 0.0
         return self.wins / self.trades_count
+
+
+# Stamp updated_at in the database on every UPDATE (recursive triggers are
+# off by default in SQLite, so the inner UPDATE doesn't re-fire it)
+event.listen(
+    AccountState.__table__,
+    'after_create',
+    DDL(
+        "CREATE TRIGGER trg_account_updated AFTER UPDATE ON account_state "
+        "BEGIN "
+        "UPDATE account_state SET updated_at = CURRENT_TIMESTAMP WHERE id = OLD.id; "
+        "END"
+    ).execute_if(dialect='sqlite'),
+)
+event.listen(
+    AccountState.__table__,
+    'after_create',
+    DDL(
+        "CREATE OR REPLACE FUNCTION account_state_set_updated_at() RETURNS trigger AS $$ "
+        "BEGIN NEW.updated_at = now(); RETURN NEW; END; "
+        "$$ LANGUAGE plpgsql"
+    ).execute_if(dialect='postgresql'),
+)
+event.listen(
+    AccountState.__table__,
+    'after_create',
+    DDL(
+        "CREATE TRIGGER trg_account_updated BEFORE UPDATE ON account_state "
+        "FOR EACH ROW EXECUTE FUNCTION account_state_set_updated_at()"
+    ).execute_if(dialect='postgresql'),
+)
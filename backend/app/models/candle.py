@@ -1,7 +1,6 @@
 """
 Candle (OHLCV) data model.
 """
-from datetime import datetime
 from sqlalchemy import (
     Column,
     Integer,
@@ -10,6 +9,7 @@ from sqlalchemy import (
     BigInteger,
     DateTime,
     Index,
+    func,
     UniqueConstraint,
 )
 from app.database import Base
@@ -25,22 +25,23 @@ class Candle(Base):
     
     __tablename__ = "candles"
     
-    id = Column(Integer, primary_key=True, index=True)
-    symbol = Column(String(20), nullable=False, index=True)
-    timeframe = Column(String(5), nullable=False, index=True)  # '5m', '15m'
-    timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    symbol = Column(String(20), nullable=False)
+    timeframe = Column(String(5), nullable=False)  # '5m', '15m'
+    timestamp = Column(DateTime(timezone=True), nullable=False)
     
-    open = Column(Numeric(10, 2), nullable=False)
-    high = Column(Numeric(10, 2), nullable=False)
-    low = Column(Numeric(10, 2), nullable=False)
-    close = Column(Numeric(10, 2), nullable=False)
+    open = Column(Numeric(10, 2, asdecimal=False), nullable=False)
+    high = Column(Numeric(10, 2, asdecimal=False), nullable=False)
+    low = Column(Numeric(10, 2, asdecimal=False), nullable=False)
+    close = Column(Numeric(10, 2, asdecimal=False), nullable=False)
     volume = Column(BigInteger, nullable=False)
     
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     __table_args__ = (
         UniqueConstraint('symbol', 'timeframe', 'timestamp', name='uix_candle_unique'),
-        Index('idx_candles_lookup', 'symbol', 'timeframe', 'timestamp'),
+        # Latest-N lookups: WHERE symbol/timeframe ORDER BY timestamp DESC
+        Index('idx_candles_lookup', symbol, timeframe, timestamp.desc()),
     )
     
     def __repr__(self) -> str:
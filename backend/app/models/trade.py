@@ -1,7 +1,6 @@
 """
 Trade record model.
 """
-from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
     Column,
@@ -10,8 +9,10 @@ from sqlalchemy import (
     Numeric,
     DateTime,
     Index,
+    func,
     JSON,
 )
+from app.config import settings
 from app.database import Base
 
 
@@ -29,30 +30,30 @@ class Trade(Base):
     
     # Trade direction and option details
     direction = Column(String(4), nullable=False)  # 'CALL', 'PUT'
-    strike = Column(Numeric(10, 2), nullable=False)
+    strike = Column(Numeric(10, 2, asdecimal=False), nullable=False)
     option_type = Column(String(2), nullable=False)  # 'CE', 'PE'
     
     # Entry details
-    entry_time = Column(DateTime(timezone=True), nullable=False, index=True)
-    entry_price = Column(Numeric(10, 2), nullable=False)
-    entry_spot_price = Column(Numeric(10, 2), nullable=False)
+    entry_time = Column(DateTime(timezone=True), nullable=False)
+    entry_price = Column(Numeric(10, 2, asdecimal=False), nullable=False)
+    entry_spot_price = Column(Numeric(10, 2, asdecimal=False), nullable=False)
     
     # Exit details
     exit_time = Column(DateTime(timezone=True), nullable=True)
-    exit_price = Column(Numeric(10, 2), nullable=True)
-    exit_spot_price = Column(Numeric(10, 2), nullable=True)
+    exit_price = Column(Numeric(10, 2, asdecimal=False), nullable=True)
+    exit_spot_price = Column(Numeric(10, 2, asdecimal=False), nullable=True)
     exit_reason = Column(String(50), nullable=True)  # 'target_hit', 'sl_hit', etc.
     
     # Risk management
-    stop_loss = Column(Numeric(10, 2), nullable=False)
-    take_profit = Column(Numeric(10, 2), nullable=False)
+    stop_loss = Column(Numeric(10, 2, asdecimal=False), nullable=False)
+    take_profit = Column(Numeric(10, 2, asdecimal=False), nullable=False)
     
     # Position sizing
     position_size = Column(Integer, nullable=False)  # number of lots
     
     # P&L
-    pnl = Column(Numeric(10, 2), nullable=True)
-    pnl_r = Column(Numeric(5, 3), nullable=True)  # P&L in R multiples
+    pnl = Column(Numeric(10, 2, asdecimal=False), nullable=True)
+    pnl_r = Column(Numeric(5, 3, asdecimal=False), nullable=True)  # P&L in R multiples
     
     # Status
     status = Column(String(20), nullable=False, default="open")  # 'open', 'closed'
@@ -61,12 +62,13 @@ class Trade(Base):
     entry_filters = Column(JSON, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     __table_args__ = (
         Index('idx_trades_entry_time', 'entry_time'),
-        Index('idx_trades_status', 'status'),
+        # Trades by status, newest first; also serves the open-trade count
+        Index('idx_trades_status_entry_time', status, entry_time.desc()),
     )
     
     def __repr__(self) -> str:
@@ -87,10 +89,14 @@ class Trade(Base):
         Returns:
             Tuple of (pnl_absolute, pnl_r)
         """
-        pnl_per_lot = (exit_price - self.entry_price) * 25  # Assuming 25 lot size
+        # Convert once so the arithmetic stays in floats even if an
+        # attribute was assigned a Decimal before flush
+        entry_price = float(self.entry_price)
+        pnl_per_lot = (float(exit_price) - entry_price) * settings.nifty_lot_size
         total_pnl = pnl_per_lot * self.position_size
         
-        # Calculate R multiple
-        pnl_r = total_pnl / risk_amount if risk_amount > 0 else 0
+        if risk_amount <= 0:
+            return total_pnl, 0.0
         
-        return float(total_pnl), float(pnl_r)
+        # Calculate R multiple
+        return total_pnl, total_pnl / risk_amount
@@ -4,16 +4,20 @@ Structured logging setup with IST timezone.
 import logging
 import sys
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
+import orjson
 from app.config import settings
 
+# Resolved once instead of on every record
+IST = settings.timezone
+
 
 class ISTFormatter(logging.Formatter):
     """Custom formatter that uses IST timezone."""
     
     def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
         """Format time in IST timezone."""
-        dt = datetime.fromtimestamp(record.created, tz=settings.timezone)
+        dt = datetime.fromtimestamp(record.created, tz=IST)
         if datefmt:
             return dt.strftime(datefmt)
         return dt.isoformat()
@@ -28,6 +32,33 @@ class ISTFormatter(logging.Formatter):
         return super().format(record)
 
 
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line, encoded with orjson."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize the record; message text is escaped by the encoder."""
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=IST).isoformat(),
+            "level": record.levelname,
+            "name": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+        }
+        if hasattr(record, 'extra_data'):
+            payload["data"] = record.extra_data
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        
+        # default=str covers Decimal, date and other non-native values;
+        # OPT_NON_STR_KEYS handles int/enum/date keys, which default skips
+        return orjson.dumps(
+            payload,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
+
 def setup_logger(name: str = "methax") -> logging.Logger:
     """
     Setup structured logger with IST timezone.
@@ -51,10 +82,7 @@ def setup_logger(name: str = "methax") -> logging.Logger:
     # Create formatter
     if settings.is_production:
         # JSON format for production
-        formatter = logging.Formatter(
-            '{"timestamp":"%(asctime)s","level":"%(levelname)s","name":"%(name)s",'
-            '"message":"%(message)s","module":"%(module)s","function":"%(funcName)s"}'
-        )
+        formatter = JSONFormatter()
     else:
         # Human-readable format for development
         formatter = ISTFormatter(
@@ -95,8 +123,56 @@ def log_filter_result(filter_name: str, passed: bool, reason: str = "") -> None:
         passed: Whether the filter passed
         reason: Reason for failure (if failed)
     """
+    # Filters run on every evaluation; skip building the message when INFO is off
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     status = "PASS" if passed else "FAIL"
     msg = f"FILTER: {filter_name} | {status}"
     if reason:
         msg += f" | {reason}"
     logger.info(msg)
+
+
+class FilterBatchLogger:
+    """
+    Collect filter results for one evaluation and log them as a single record.
+    
+    Usage:
+        with FilterBatchLogger() as filters:
+            filters.add("ema_trend", True)
+            filters.add("atr", False, "ATR below threshold")
+    """
+    
+    def __init__(self) -> None:
+        self.results: List[Tuple[str, bool, str]] = []
+    
+    def add(self, filter_name: str, passed: bool, reason: str = "") -> None:
+        """
+        Record a filter evaluation result.
+        
+        Args:
+            filter_name: Name of the filter
+            passed: Whether the filter passed
+            reason: Reason for failure (if failed)
+        """
+        self.results.append((filter_name, passed, reason))
+    
+    def __enter__(self) -> "FilterBatchLogger":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if not self.results or not logger.isEnabledFor(logging.INFO):
+            return
+        
+        passed_count = sum(1 for _, passed, _ in self.results if passed)
+        data = {
+            name: ("PASS" if passed else "FAIL", reason)
+            for name, passed, reason in self.results
+        }
+        # stacklevel=2 attributes the record to the function using the batch
+        logger.info(
+            f"FILTERS: {passed_count}/{len(self.results)} passed",
+            extra={'extra_data': data},
+            stacklevel=2,
+        )
@@ -1,7 +1,8 @@
 """
 Input validation helpers.
 """
-from typing import Optional
+from functools import lru_cache
+from typing import NamedTuple, Optional
 from datetime import datetime, time
 from pydantic import BaseModel, Field, field_validator
 from app.config import settings
@@ -46,30 +47,115 @@ class DashboardResponse(BaseModel):
     risk_status: DashboardRiskStatus
 
 
-def is_market_open(current_time: Optional[datetime] = None) -> bool:
+# Market hours parsed once at import instead of on every request
+MARKET_OPEN = settings.get_time(settings.market_open_time)
+MARKET_CLOSE = settings.get_time(settings.market_close_time)
+NO_TRADE_END_MORNING = settings.get_time(settings.no_trade_end_morning)
+NO_TRADE_START_EOD = settings.get_time(settings.no_trade_start_eod)
+
+
+class MarketState(NamedTuple):
+    """Market hours evaluation for a point in time."""
+    is_open: bool
+    can_trade: bool
+    reason: str
+    minutes_to_close: int
+
+
+def evaluate_market_state(current_time: Optional[datetime] = None) -> MarketState:
     """
-    Check if market is currently open.
+    Evaluate market open status, trading window and time to close in one pass.
+    
+    Market hours are configured to the minute, so the result is memoized
+    per (weekday, hour, minute). Whether the time falls exactly on the minute
+    is part of the key: the close minute is open only at its first instant,
+    and minutes_to_close counts whole minutes remaining.
     
     Args:
         current_time: Time to check (defaults to now in IST)
         
     Returns:
-        True if market is open
+        MarketState for the given time
     """
     if current_time is None:
         current_time = datetime.now(settings.timezone)
     
-    # Extract just the time component
-    check_time = current_time.time()
+    return _market_state_for_minute(
+        current_time.weekday(),
+        current_time.hour,
+        current_time.minute,
+        current_time.second == 0 and current_time.microsecond == 0,
+    )
+
+
+@lru_cache(maxsize=8)
+def _market_state_for_minute(
+    weekday: int,
+    hour: int,
+    minute: int,
+    at_minute_start: bool
+) -> MarketState:
+    """
+    Compute market state for a minute of the week (cached).
+    
+    Args:
+        weekday: Day of week (Monday=0, Sunday=6)
+        hour: Hour (IST)
+        minute: Minute
+        at_minute_start: Time is exactly hh:mm:00.000000
+        
+    Returns:
+        MarketState for times in that minute
+    """
+    check_time = time(hour=hour, minute=minute)
+    
+    # Check if weekday (Monday=0, Sunday=6) within market hours; the close
+    # bound is inclusive, so past hh:mm:00 the close minute is already closed
+    is_open = (
+        weekday < 5
+        and MARKET_OPEN <= check_time <= MARKET_CLOSE
+        and (check_time < MARKET_CLOSE or at_minute_start)
+    )
     
-    # Get market hours
-    market_open = settings.get_time(settings.market_open_time)
-    market_close = settings.get_time(settings.market_close_time)
+    if not is_open:
+        can_trade, reason = False, "Market is closed"
+    elif check_time < NO_TRADE_END_MORNING:
+        # Morning buffer (09:15 - 09:30)
+        can_trade, reason = False, "Within morning buffer period (09:15-09:30)"
+    elif check_time >= NO_TRADE_START_EOD:
+        # EOD buffer (after 14:45 on non-expiry days)
+        # TODO: Add expiry day detection logic
+        # For now, assume non-expiry day
+        can_trade, reason = False, "Within EOD buffer period (after 14:45)"
+    else:
+        can_trade, reason = True, "Valid trading time"
     
-    # Check if weekday (Monday=0, Sunday=6)
-    is_weekday = current_time.weekday() < 5
+    # Whole minutes remaining: one fewer once the minute has started
+    close_minutes = MARKET_CLOSE.hour * 60 + MARKET_CLOSE.minute
+    minutes_left = close_minutes - (hour * 60 + minute)
+    if not at_minute_start:
+        minutes_left -= 1
+    minutes_to_close = max(0, minutes_left)
     
-    return is_weekday and market_open <= check_time <= market_close
+    return MarketState(
+        is_open=is_open,
+        can_trade=can_trade,
+        reason=reason,
+        minutes_to_close=minutes_to_close,
+    )
+
+
+def is_market_open(current_time: Optional[datetime] = None) -> bool:
+    """
+    Check if market is currently open.
+    
+    Args:
+        current_time: Time to check (defaults to now in IST)
+        
+    Returns:
+        True if market is open
+    """
+    return evaluate_market_state(current_time).is_open
 
 
 def is_time_valid_for_trading(current_time: Optional[datetime] = None) -> tuple[bool, str]:
@@ -82,28 +168,8 @@ def is_time_valid_for_trading(current_time: Optional[datetime] = None) -> tuple[
     Returns:
         Tuple of (is_valid, reason)
     """
-    if current_time is None:
-        current_time = datetime.now(settings.timezone)
-    
-    # Check if market is open first
-    if not is_market_open(current_time):
-        return False, "Market is closed"
-    
-    check_time = current_time.time()
-    
-    # Morning buffer (09:15 - 09:30)
-    no_trade_end_morning = settings.get_time(settings.no_trade_end_morning)
-    if check_time < no_trade_end_morning:
-        return False, "Within morning buffer period (09:15-09:30)"
-    
-    # EOD buffer (after 14:45 on non-expiry days)
-    no_trade_eod = settings.get_time(settings.no_trade_start_eod)
-    # TODO: Add expiry day detection logic
-    # For now, assume non-expiry day
-    if check_time >= no_trade_eod:
-        return False, "Within EOD buffer period (after 14:45)"
-    
-    return True, "Valid trading time"
+    state = evaluate_market_state(current_time)
+    return state.can_trade, state.reason
 
 
 def get_minutes_to_close(current_time: Optional[datetime] = None) -> int:
@@ -116,18 +182,4 @@ def get_minutes_to_close(current_time: Optional[datetime] = None) -> int:
     Returns:
         Minutes to close
     """
-    if current_time is None:
-        current_time = datetime.now(settings.timezone)
-    
-    market_close = settings.get_time(settings.market_close_time)
-    
-    # Create datetime for market close today
-    close_datetime = current_time.replace(
-        hour=market_close.hour,
-        minute=market_close.minute,
-        second=0,
-        microsecond=0
-    )
-    
-    diff = close_datetime - current_time
-    return max(0, int(diff.total_seconds() / 60))
+    return evaluate_market_state(current_time).minutes_to_close
@@ -1,15 +1,32 @@
 #!/usr/bin/env python3
 """
 Display contents of methax.db SQLite database.
-Shows all tables and their data.
+Shows all tables and their data as CSV (first 100 rows each; --all for everything).
 """
+import argparse
+import csv
 import sqlite3
+import sys
 from pathlib import Path
-from tabulate import tabulate
+from typing import Optional
 
+# Default rows shown per table
+DEFAULT_LIMIT = 100
 
-def display_db_contents():
-    """Display all tables and their contents from methax.db."""
+# Rows fetched from the cursor per write
+FETCH_CHUNK_SIZE = 1000
+
+
+def display_db_contents(limit: Optional[int] = DEFAULT_LIMIT):
+    """
+    Display all tables and their contents from methax.db.
+    
+    Rows are streamed to stdout as CSV in chunks rather than buffered,
+    so large candle tables don't have to fit in memory.
+    
+    Args:
+        limit: Maximum rows per table (None for all rows)
+    """
     
     db_path = Path(__file__).parent / "methax.db"
     
@@ -18,8 +35,12 @@ def display_db_contents():
         return
     
     try:
-        conn = sqlite3.connect(db_path)
+        # Autocommit + read-only: never holds a write transaction or
+        # contends with the running backend's WAL checkpoints
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        conn.execute("PRAGMA query_only=1")
         cursor = conn.cursor()
+        writer = csv.writer(sys.stdout, lineterminator="\n")
         
         # Get all table names
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
@@ -34,18 +55,24 @@ def display_db_contents():
         print("="*80 + "\n")
         
         for table_name, in tables:
-            cursor.execute(f"SELECT * FROM {table_name}")
-            rows = cursor.fetchall()
-            
-            # Get column names
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = [col[1] for col in cursor.fetchall()]
+            row_count = cursor.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
             
             print(f"📋 Table: {table_name.upper()}")
-            print(f"   Rows: {len(rows)}")
+            print(f"   Rows: {row_count}")
             
-            if rows:
-                print(f"\n{tabulate(rows, headers=columns, tablefmt='grid')}\n")
+            if row_count:
+                if limit is None:
+                    cursor.execute(f"SELECT * FROM {table_name}")
+                else:
+                    cursor.execute(f"SELECT * FROM {table_name} LIMIT ?", (limit,))
+                    if row_count > limit:
+                        print(f"   (showing first {limit}; use --all for every row)")
+                
+                print()
+                writer.writerow(col[0] for col in cursor.description)
+                while chunk := cursor.fetchmany(FETCH_CHUNK_SIZE):
+                    writer.writerows(chunk)
+                print()
             else:
                 print("   (Empty table)\n")
             
@@ -59,4 +86,12 @@ def display_db_contents():
 
 
 if __name__ == "__main__":
-    display_db_contents()
+    parser = argparse.ArgumentParser(description="Display methax.db contents as CSV")
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help=f"Dump every row instead of the first {DEFAULT_LIMIT} per table",
+    )
+    args = parser.parse_args()
+    
+    display_db_contents(limit=None if args.all else DEFAULT_LIMIT)
@@ -4,11 +4,24 @@ Backend server entry point.
 import uvicorn
 from app.config import settings
 
-if __name__ == "__main__":
+
+def main() -> None:
+    """Run the API server with uvicorn."""
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
+        # uvloop/httptools come with uvicorn[standard]; pin them rather than "auto"
+        loop="uvloop",
+        http="httptools",
         reload=settings.is_development,
+        # reload needs a single process. Every worker keeps its own pool of
+        # db_pool_size (+ db_max_overflow) connections, so keep
+        # workers * (pool_size + max_overflow) under the server's limit
+        workers=1 if settings.is_development else settings.workers,
         log_level=settings.log_level.lower(),
     )
+
+
+if __name__ == "__main__":
+    main()
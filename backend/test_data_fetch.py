@@ -10,8 +10,8 @@ from pathlib import Path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
-from app.data.nifty_fetcher import NIFTYDataFetcher
-from app.database import AsyncSessionLocal
+from app.data.nifty_fetcher import get_nifty_fetcher
+from app.database import AsyncSessionLocal, close_db
 from app.utils.logger import logger
 
 
@@ -23,11 +23,11 @@ async def test_data_fetching():
     print("="*60 + "\n")
     
     # Initialize fetcher
-    fetcher = NIFTYDataFetcher()
+    fetcher = get_nifty_fetcher()
     
     # Test 1: Get current price
     print("📊 Test 1: Getting current NIFTY price...")
-    current_price = fetcher.get_current_price()
+    current_price = await fetcher.get_current_price()
     if current_price:
         print(f"✅ Current NIFTY price: ₹{current_price:,.2f}\n")
     else:
@@ -67,11 +67,11 @@ async def test_data_fetching():
     print("💾 Test 4: Saving data to database...")
     async with AsyncSessionLocal() as db:
         if not df_5m.empty:
-            saved_5m = await fetcher.save_candles_to_db(df_5m, '5m', db)
+            saved_5m = await fetcher.save_candles_to_db(df_5m, '5m', db, overwrite=False)
             print(f"✅ Saved {saved_5m} new 5m candles to database")
         
         if not df_15m.empty:
-            saved_15m = await fetcher.save_candles_to_db(df_15m, '15m', db)
+            saved_15m = await fetcher.save_candles_to_db(df_15m, '15m', db, overwrite=False)
             print(f"✅ Saved {saved_15m} new 15m candles to database")
         
         # Test 5: Retrieve from database
@@ -84,6 +84,9 @@ async def test_data_fetching():
             print(f"   Latest candle: {latest.timestamp}")
             print(f"   OHLC: O:{latest.open} H:{latest.high} L:{latest.low} C:{latest.close}")
     
+    # Release pooled connections so the script can exit
+    await close_db()
+    
     print("\n" + "="*60)
     print("  All tests complete!")
     print("="*60 + "\n")